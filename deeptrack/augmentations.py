@@ -430,7 +430,7 @@ class Affine(Augmentation):
                 **kwargs
             )
 
-            new_image = Image(new_image)
+            new_image = Image(new_image, copy=False)
             new_image.merge_properties_from(image)
             image = new_image
 
@@ -11,6 +11,9 @@ StructuralFeature
 Branch
     Implementation of `StructuralFeature` that resolves two features
     sequentially.
+Chain
+    Implementation of `StructuralFeature` that resolves a list of features
+    sequentially.
 Probability
     Implementation of `StructuralFeature` that randomly resolves a feature
     with a certain probability.
@@ -28,7 +31,7 @@ import numpy as np
 import threading
 
 from .image import Image
-from .properties import Property, PropertyDict
+from .properties import Property, PropertyDict, SequentialProperty, SHARE_ARRAY_VALUES
 
 
 MERGE_STRATEGY_OVERRIDE = 0
@@ -196,8 +199,8 @@ class Feature:
         # Add feature_input to the image the class attribute __property_memorability__
         # is not larger than the passed property_verbosity keyword
         property_verbosity = global_kwargs.get("property_memorability", 1)
-        feature_input["name"] = type(self).__name__
         if self.__property_memorability__ <= property_verbosity:
+            feature_input["name"] = type(self).__name__
             for index, image in enumerate(new_list):
                 if isinstance(image, tuple):
                     image[0].append({**feature_input, **image[1]})
@@ -241,7 +244,18 @@ class Feature:
             return self
 
     def _update(self, **kwargs):
+        # A feature can be reached through several properties during one
+        # update. Its properties are memoized after the first visit, so
+        # later visits are skipped by id. The feature itself is stored to
+        # ensure its id is not reused before the memo is cleared.
+        my_id = id(self)
+        if UPDATE_LOCK.locked():
+            if my_id in UPDATE_MEMO["memoization"]:
+                return self
+            UPDATE_MEMO["memoization"][my_id] = self
+
         self.properties.update(**kwargs)
+        return self
 
     def plot(
         self,
@@ -399,7 +413,7 @@ class Feature:
             other = Combine(features=other)
 
         if isinstance(other, Feature):
-            return Branch(self, other)
+            return Chain(_get_chained_features(self) + _get_chained_features(other))
 
     def __radd__(self, other) -> "Feature":
         # Add when left hand is not a feature
@@ -409,7 +423,7 @@ class Feature:
             other = Combine(features=other)
 
         if isinstance(other, Feature):
-            return Branch(other, self)
+            return Chain(_get_chained_features(other) + _get_chained_features(self))
         elif not other:
             return self
         else:
@@ -461,9 +475,59 @@ class Branch(StructuralFeature):
         return image
 
 
+class Chain(StructuralFeature):
+    """Resolves a list of features sequentially.
+    Passes the output of each feature to the input of the next.
+    Adding features together creates a single `Chain`, such that
+    `A + B + C` is resolved in one loop instead of as nested features.
+    The properties of the output image therefore contain a single entry
+    for the `Chain`, instead of one entry per nested `Branch`.
+
+    Parameters
+    ----------
+    features : list of features
+        The features to resolve, in order.
+    """
+
+    def __init__(self, features: List[Feature], *args, **kwargs):
+        super().__init__(*args, features=features, **kwargs)
+
+    def get(self, image, features, **kwargs):
+        """Resolves each feature in `features` sequentially"""
+        for feature in features:
+            image = feature.resolve(image, **kwargs)
+        return image
+
+
+def _get_chained_features(feature: Feature) -> List[Feature]:
+    # Returns the features that `feature` resolves sequentially, such that
+    # adding to a chain extends it rather than nesting it. Chains with
+    # additional properties pass these on to their features, so they are
+    # kept as a single feature.
+    # Only chains of a fixed list of features are extended. Other sampling
+    # rules, such as functions or iterators, are kept as they are.
+    if (
+        type(feature) is Chain
+        and set(feature.properties) == {"features", "hash_key"}
+        and isinstance(feature.properties["features"].sampling_rule, list)
+    ):
+        return list(feature.properties["features"].sampling_rule)
+    return [feature]
+
+
 class Probability(StructuralFeature):
     """Resolves a feature with a certain probability
 
+    The feature is only updated when it is going to be resolved, so
+    features with a low probability do not resample their properties
+    every update. If `probability` or `random_number` are overridden
+    when resolving, a feature that was skipped is updated before it is
+    resolved.
+
+    The feature is stored as the attribute `feature`, not as a property.
+    It is therefore not a `Property`, and is not included in the
+    properties of the output image.
+
     Parameters
     ----------
     feature : Feature
@@ -473,28 +537,70 @@ class Probability(StructuralFeature):
     """
 
     def __init__(self, feature: Feature, probability: float, *args, **kwargs):
+        self.feature = feature
+        self._feature_updated = False
+        self._update_kwargs = {}
+        self._update_user_arguments = {}
         super().__init__(
             *args,
-            feature=feature,
             probability=probability,
             random_number=np.random.rand,
             **kwargs
         )
 
-    def get(
-        self,
-        image,
-        feature: Feature,
-        probability: float,
-        random_number: float,
-        **kwargs
-    ):
+    def get(self, image, probability: float, random_number: float, **kwargs):
         """Resolves `feature` if `random_number` is less than `probability`"""
         if random_number < probability:
-            image = feature.resolve(image, **kwargs)
+            if not self._feature_updated:
+                self._update_feature()
+            image = self.feature.resolve(image, **kwargs)
 
         return image
 
+    def _update(self, **kwargs):
+        super()._update(**kwargs)
+        self._update_kwargs = kwargs
+        self._update_user_arguments = UPDATE_MEMO["user_arguments"]
+
+        random_number = self.random_number.current_value
+        probability = self.probability.current_value
+        if (
+            isinstance(self.random_number, SequentialProperty)
+            or isinstance(self.probability, SequentialProperty)
+            or np.ndim(random_number) != 0
+            or np.ndim(probability) != 0
+        ):
+            # Sequential values are compared per step when resolving. The
+            # feature is updated since it may be resolved at any step.
+            self._feature_updated = True
+        else:
+            self._feature_updated = random_number < probability
+
+        if self._feature_updated:
+            self.feature._update(**kwargs)
+        return self
+
+    def _update_feature(self):
+        # Updates the feature as part of the last update of this feature,
+        # with the same arguments. Properties already updated in that call
+        # are memoized, and are not resampled.
+        if UPDATE_LOCK.locked():
+            self._update_feature_with_arguments()
+        else:
+            with UPDATE_LOCK:
+                self._update_feature_with_arguments()
+        self._feature_updated = True
+
+    def _update_feature_with_arguments(self):
+        # The global user arguments may come from a later update of
+        # another feature, so they are replaced while updating.
+        user_arguments = UPDATE_MEMO["user_arguments"]
+        UPDATE_MEMO["user_arguments"] = self._update_user_arguments
+        try:
+            self.feature._update(**self._update_kwargs)
+        finally:
+            UPDATE_MEMO["user_arguments"] = user_arguments
+
 
 class Duplicate(StructuralFeature):
     """Resolves copies of a feature sequentially
@@ -515,8 +621,11 @@ class Duplicate(StructuralFeature):
         super().__init__(
             *args,
             num_duplicates=num_duplicates,  # py > 3.6 dicts are ordered by insert time.
+            # The copies are updated before they are resolved, so their
+            # array values are shared rather than copied.
             features=lambda num_duplicates: [
-                copy.deepcopy(self.feature) for _ in range(num_duplicates)
+                copy.deepcopy(self.feature, {SHARE_ARRAY_VALUES: True})
+                for _ in range(num_duplicates)
             ],
             **kwargs
         )
@@ -575,7 +684,22 @@ class Combine(StructuralFeature):
         super().__init__(features=features, **kwargs)
 
     def get(self, image_list, features, **kwargs):
-        return [feature.resolve(image_list, **kwargs) for feature in features]
+        # A feature resolved with the same input gives the same output, so
+        # features included more than once are only resolved once. Repeated
+        # outputs are copied to keep the images in the output independent.
+        resolved_features = {}
+        output = []
+        for feature in features:
+            if id(feature) not in resolved_features:
+                resolved_features[id(feature)] = feature.resolve(image_list, **kwargs)
+                output.append(resolved_features[id(feature)])
+            elif isinstance(resolved_features[id(feature)], list):
+                output.append(
+                    [Image(image) for image in resolved_features[id(feature)]]
+                )
+            else:
+                output.append(Image(resolved_features[id(feature)]))
+        return output
 
 
 class Bind(StructuralFeature):
@@ -888,8 +1012,21 @@ class LoadImage(Feature):
             path = [path]
         if load_options is None:
             load_options = {}
+
+        # If a single random image is extracted from the stack, numpy files
+        # are memory-mapped such that only that image is read from disk.
+        numpy_load_options = load_options
+        if as_list and get_one_random:
+            numpy_load_options = {"mmap_mode": "r", **load_options}
+
         try:
-            image = [np.load(file, **load_options) for file in path]
+            try:
+                image = [np.load(file, **numpy_load_options) for file in path]
+            except ValueError:
+                if numpy_load_options is load_options:
+                    raise
+                # Some arrays, such as object arrays, cannot be memory-mapped
+                image = [np.load(file, **load_options) for file in path]
         except (IOError, ValueError):
             try:
                 from skimage import io
@@ -909,6 +1046,19 @@ class LoadImage(Feature):
                             "No filereader available for file {0}".format(path)
                         )
 
+        is_one_random_extracted = (
+            as_list
+            and get_one_random
+            and all(isinstance(file_image, np.memmap) for file_image in image)
+            and image[0].ndim >= 1
+            # Files of different shapes cannot be stacked, and raise below
+            and all(file_image.shape == image[0].shape for file_image in image)
+            and not (ndim and image[0].ndim + 1 < ndim)
+        )
+        if is_one_random_extracted:
+            index = np.random.randint(len(image[0]))
+            image = [np.array(file_image[index]) for file_image in image]
+
         image = np.stack(image, axis=-1)
 
         if to_grayscale:
@@ -921,7 +1071,11 @@ class LoadImage(Feature):
 
                 warnings.warn("Non-rgb image, ignoring to_grayscale")
 
-        if ndim and image.ndim < ndim:
+        if is_one_random_extracted:
+            # The image has already been extracted from the stack
+            pass
+
+        elif ndim and image.ndim < ndim:
             image = np.expand_dims(image, axis=-1)
 
         elif as_list:
@@ -1004,8 +1158,7 @@ class SampleToMasks(Feature):
 
                 if "position" in prop:
 
-                    inp = Image(np.array(images))
-                    inp.append(prop)
+                    inp = Image(images, properties=[prop])
                     out = Image(self.get(inp, **kwargs))
                     out.merge_properties_from(inp)
                     list_of_labels.append(out)
@@ -1096,7 +1249,7 @@ class SampleToMasks(Feature):
                             output_slice[..., label_index],
                             labelarg[..., label_index],
                         )
-        output = Image(output)
+        output = Image(output, copy=False)
         for label in list_of_labels:
             output.merge_properties_from(label)
         return output
@@ -90,7 +90,7 @@ class Generator(keras.utils.Sequence):
                         for sample_from in contains_class + [
                             list(range(len(batch)))
                         ] * (batch_size - len(contains_class)):
-                            index = np.random.choice(sample_from)
+                            index = sample_from[np.random.randint(len(sample_from))]
                             sub_batch.append(batch[index])
                             sub_labels.append(labels[index])
                     else:
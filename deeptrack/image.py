@@ -37,6 +37,9 @@ class Image(np.ndarray):
         An array_like object that is used to instantiate the ndarray.
     properties : list of dicts, optional
         Optional parameter to set as the initial value for the field properties.
+    copy : bool, optional
+        Whether to copy the data of `input_array`. Only pass False for
+        newly allocated arrays that are not referenced elsewhere.
 
     Attributes
     ----------
@@ -50,11 +53,14 @@ class Image(np.ndarray):
     # This ensures that the output will always be an Image
     __array_priority__ = 999
 
-    def __new__(cls, input_array, properties=None):
+    def __new__(cls, input_array, properties=None, copy=True):
         # Converts input to ndarray, and then to an Image
         # In particular, it creates the properties
 
-        image = np.array(input_array).view(cls)
+        if copy:
+            image = np.array(input_array).view(cls)
+        else:
+            image = np.asarray(input_array).view(cls)
         if properties is None:
             # If input_array has properties attribute, retrieve a copy of it
             properties = getattr(input_array, "properties", [])[:]
@@ -132,6 +138,14 @@ class Image(np.ndarray):
 
         """
 
+        # Collect the hash keys once, instead of scanning the properties
+        # of self for every property of other.
+        hash_keys = set(
+            tuple(my_prop["hash_key"])
+            for my_prop in self.properties
+            if "hash_key" in my_prop
+        )
+
         for new_prop in other.properties:
 
             # If no hash_key, add it
@@ -139,20 +153,10 @@ class Image(np.ndarray):
                 self.append(new_prop)
                 continue
 
-            should_append = True
             # Else, see if hash is unique
-            for my_prop in self.properties:
-
-                if (
-                    "hash_key" in my_prop
-                    and my_prop["hash_key"] == new_prop["hash_key"]
-                ):
-
-                    # Key is not unique, don't add
-                    should_append = False
-                    break
-
-            if should_append:
+            hash_key = tuple(new_prop["hash_key"])
+            if hash_key not in hash_keys:
+                hash_keys.add(hash_key)
                 self.append(new_prop)
 
         return self
@@ -166,7 +170,9 @@ class Image(np.ndarray):
         if image_after_function is self:  # for in-place operations
             image_with_restored_properties = image_after_function
         else:
-            image_with_restored_properties = Image(image_after_function)
+            # The output of a ufunc is a newly allocated array, so it can be
+            # viewed as an Image directly instead of being copied.
+            image_with_restored_properties = image_after_function.view(Image)
 
         if context is not None:
             # context is information about operation
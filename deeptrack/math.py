@@ -118,7 +118,7 @@ class Average(Feature):
     def get(self, images, axis, features, **kwargs):
         if features is not None:
             images = [feature.resolve() for feature in features]
-        result = Image(np.mean(images, axis=axis))
+        result = Image(np.mean(images, axis=axis), copy=False)
 
         for image in images:
             result.merge_properties_from(image)
@@ -82,6 +82,8 @@ class Poisson(Noise):
         peak = np.abs(np.max(image) - background)
 
         rescale = snr ** 2 / peak ** 2
-        noisy_image = Image(np.random.poisson(image * rescale) / rescale)
+        noisy_image = Image(
+            np.random.poisson(image * rescale) / rescale, copy=False
+        )
         noisy_image.properties = image.properties
         return noisy_image
@@ -15,6 +15,8 @@ Brightfield
     Images coherently illuminated samples.
 """
 
+import threading
+
 import numpy as np
 from .features import Feature, StructuralFeature
 from .image import Image, pad_image_to_fft
@@ -22,6 +24,16 @@ from .image import Image, pad_image_to_fft
 from scipy.ndimage import convolve
 
 
+# Maximum number of pupil grids kept by _get_pupil_grid.
+PUPIL_GRID_CACHE_SIZE = 16
+
+# Unaberrated pupil grids, keyed by shape and optical parameters.
+_PUPIL_GRID_CACHE = {}
+
+# Guards _PUPIL_GRID_CACHE, which is shared by generator threads.
+_PUPIL_GRID_CACHE_LOCK = threading.Lock()
+
+
 class Microscope(StructuralFeature):
     """Image a sample using an optical system.
 
@@ -207,36 +219,12 @@ class Optics(Feature):
         **kwargs
     ):
         # Calculates the pupil at each z-position in defocus.
-        shape = np.array(shape)
-
-        # Pupil radius
-        R = NA / wavelength * np.array(voxel_size)[:2]
-
-        x_radius = R[0] * shape[0]
-        y_radius = R[1] * shape[1]
-
-        x = (np.linspace(-(shape[0] / 2), shape[0] / 2 - 1, shape[0])) / x_radius + 1e-8
-        y = (np.linspace(-(shape[1] / 2), shape[1] / 2 - 1, shape[1])) / y_radius + 1e-8
-
-        W, H = np.meshgrid(y, x)
-        RHO = W ** 2 + H ** 2
-        RHO[RHO > 1] = 1
-        pupil_function = ((RHO < 1) * 1.0).astype(np.complex)
-        # Defocus
-        z_shift = (
-            2
-            * np.pi
-            * refractive_index_medium
-            / wavelength
-            * voxel_size[2]
-            * np.sqrt(1 - (NA / refractive_index_medium) ** 2 * RHO)
+        pupil_function, z_shift, pupil_function_is_nonzero = _get_pupil_grid(
+            shape, NA, wavelength, refractive_index_medium, voxel_size
         )
 
-        # Downsample the upsampled pupil
-
-        pupil_function[np.isnan(pupil_function)] = 0
-        pupil_function[np.isinf(pupil_function)] = 0
-        pupil_function_is_nonzero = pupil_function != 0
+        # The cached pupil is shared, so it is copied before being modified.
+        pupil_function = np.array(pupil_function)
 
         if include_aberration:
             pupil = pupil or aberration
@@ -388,7 +376,7 @@ class Fluorescence(Optics):
         ]
         z_limits = limits[2, :]
 
-        output_image = Image(np.zeros((*padded_volume.shape[0:2], 1)))
+        output_image = Image(np.zeros((*padded_volume.shape[0:2], 1)), copy=False)
 
         index_iterator = range(padded_volume.shape[2])
 
@@ -423,7 +411,7 @@ class Fluorescence(Optics):
             fourier_field = np.fft.fft2(image)
             convolved_fourier_field = fourier_field * optical_transfer_function
 
-            field = Image(np.fft.ifft2(convolved_fourier_field))
+            field = Image(np.fft.ifft2(convolved_fourier_field), copy=False)
 
             # Discard remaining imaginary part (should be 0 up to rounding error)
             field = np.real(field)
@@ -519,7 +507,7 @@ class Brightfield(Optics):
         ]
         z_limits = limits[2, :]
 
-        output_image = Image(np.zeros((*padded_volume.shape[0:2], 1)))
+        output_image = Image(np.zeros((*padded_volume.shape[0:2], 1)), copy=False)
 
         index_iterator = range(padded_volume.shape[2])
         z_iterator = np.linspace(
@@ -722,6 +710,77 @@ def _get_position(image, mode="corner", return_z=False):
     return position
 
 
+def _get_pupil_grid(shape, NA, wavelength, refractive_index_medium, voxel_size):
+    # Returns the unaberrated pupil function, the defocus phase per unit
+    # distance and the nonzero mask of the pupil. These only depend on the
+    # shape and the optical parameters, which are usually the same for each
+    # resolve, so the result is cached. The returned arrays are read-only.
+
+    try:
+        key = (
+            tuple(int(s) for s in shape),
+            float(NA),
+            float(wavelength),
+            float(refractive_index_medium),
+            tuple(float(v) for v in np.ravel(voxel_size)),
+        )
+    except TypeError:
+        key = None
+
+    if key is not None:
+        with _PUPIL_GRID_CACHE_LOCK:
+            grid = _PUPIL_GRID_CACHE.get(key)
+        if grid is not None:
+            return grid
+
+    shape = np.array(shape)
+
+    # Pupil radius
+    R = NA / wavelength * np.array(voxel_size)[:2]
+
+    x_radius = R[0] * shape[0]
+    y_radius = R[1] * shape[1]
+
+    x = (np.linspace(-(shape[0] / 2), shape[0] / 2 - 1, shape[0])) / x_radius + 1e-8
+    y = (np.linspace(-(shape[1] / 2), shape[1] / 2 - 1, shape[1])) / y_radius + 1e-8
+
+    W, H = np.meshgrid(y, x)
+    RHO = W ** 2 + H ** 2
+    RHO[RHO > 1] = 1
+    pupil_function = ((RHO < 1) * 1.0).astype(np.complex)
+    # Defocus
+    z_shift = (
+        2
+        * np.pi
+        * refractive_index_medium
+        / wavelength
+        * voxel_size[2]
+        * np.sqrt(1 - (NA / refractive_index_medium) ** 2 * RHO)
+    )
+
+    # Downsample the upsampled pupil
+
+    pupil_function[np.isnan(pupil_function)] = 0
+    pupil_function[np.isinf(pupil_function)] = 0
+    pupil_function_is_nonzero = pupil_function != 0
+
+    grid = (pupil_function, z_shift, pupil_function_is_nonzero)
+
+    if key is not None:
+        for array in grid:
+            array.setflags(write=False)
+
+        with _PUPIL_GRID_CACHE_LOCK:
+            # Evict the oldest entries
+            while _PUPIL_GRID_CACHE and (
+                len(_PUPIL_GRID_CACHE) >= PUPIL_GRID_CACHE_SIZE
+            ):
+                del _PUPIL_GRID_CACHE[next(iter(_PUPIL_GRID_CACHE))]
+            _PUPIL_GRID_CACHE[key] = grid
+
+    return grid
+
+
 def _create_volume(
     list_of_scatterers,
     pad=(0, 0, 0, 0),
@@ -29,6 +29,15 @@ from . import features
 import copy
 import collections
 
+# Incremented whenever the current value of any property is set. Used by
+# PropertyDict to know when its cached current values are outdated.
+_CURRENT_VALUE_VERSION = 0
+
+# Key set in the memo of a deepcopy when the copies are resampled before they
+# are used, such as by Duplicate. Array current values are then shared rather
+# than copied.
+SHARE_ARRAY_VALUES = "share_array_values"
+
 
 class Property:
     """Represents a property of a feature
@@ -78,7 +87,9 @@ class Property:
 
     @current_value.setter
     def current_value(self, updated_current_value):
+        global _CURRENT_VALUE_VERSION
         self._current_value = updated_current_value
+        _CURRENT_VALUE_VERSION += 1
         if id(self) not in features.UPDATE_MEMO["memoization"]:
             # Some values work, some don't. self, updated_current_value and self._current_value work
             # Best guess is an error in the gc reference counter causing it to dereference
@@ -246,6 +257,13 @@ class Property:
             )  # Create a new instance of the object based on extracted class
             memo[id(self)] = result
             for k, v in self.__dict__.items():
+                if (
+                    k == "_current_value"
+                    and isinstance(v, np.ndarray)
+                    and memo.get(SHARE_ARRAY_VALUES, False)
+                ):
+                    setattr(result, k, v)
+                    continue
                 setattr(
                     result, k, copy.deepcopy(v, memo)
                 )  # Copy over attributes by copying directly or in case of complex objects like lists for exaample calling the `__deepcopy()__` method defined by them. Thus recursively copying the whole tree of objects.
@@ -368,15 +386,50 @@ class PropertyDict(collections.OrderedDict):
             if hasattr(v, "parent") and not v.parent:
                 v.parent = self
 
+    def __setitem__(self, key, value):
+        self._current_value_dict_cache = None
+        super().__setitem__(key, value)
+
+    def __reduce__(self):
+        # The cached current values are left out when copying or pickling,
+        # so that copies do not duplicate them.
+        cls, args, state, listitems, dictitems = super().__reduce__()
+        if state:
+            state = {
+                key: value
+                for key, value in state.items()
+                if key != "_current_value_dict_cache"
+            } or None
+        return cls, args, state, listitems, dictitems
+
     def current_value_dict(self, **kwargs) -> dict:
         """Retrieves the current value of all properties as a dictionary
 
+        The dictionary is cached until the current value of any property
+        changes, so repeated calls between updates do not walk the
+        properties again.
+
         Returns
         -------
         dict
             A dictionary with the current value of all properties
 
         """
+        sequence_step = kwargs.get("sequence_step", None)
+
+        cache = getattr(self, "_current_value_dict_cache", None)
+        if cache is not None and cache[0] == (
+            _CURRENT_VALUE_VERSION,
+            len(self),
+            sequence_step,
+        ):
+            return dict(cache[1])
+
+        # The version is read before the walk, since reading a property
+        # that has not been sampled yet can update properties already read.
+        # The cache is then outdated, and is rebuilt on the next call.
+        version = _CURRENT_VALUE_VERSION
+
         current_value_dict = {}
         for key, property in self.items():
 
@@ -385,13 +438,17 @@ class PropertyDict(collections.OrderedDict):
             # If the property is sequential, retrieve the value
             # of the current timestep
             if isinstance(property, SequentialProperty):
-                sequence_step = kwargs.get("sequence_step", None)
                 if sequence_step is not None:
                     property_value = property_value[sequence_step]
 
             current_value_dict[key] = property_value
 
-        return current_value_dict
+        self._current_value_dict_cache = (
+            (version, len(self), sequence_step),
+            current_value_dict,
+        )
+
+        return dict(current_value_dict)
 
     def update(self, **kwargs) -> "PropertyDict":
         """Updates all properties
@@ -103,15 +103,47 @@ def get_kwarg_names(function: Callable) -> List[str]:
 
     """
 
+    # The names only depend on the code object, which is shared by every
+    # function created from the same definition. Keying on it instead of
+    # the function does not keep the function or its closure alive.
+    code = getattr(getattr(function, "__func__", function), "__code__", None)
+
+    if (
+        code is None
+        or hasattr(function, "__signature__")
+        or hasattr(getattr(function, "__func__", None), "__signature__")
+    ):
+        # Callable objects and builtins are not cached. Neither are
+        # functions with an explicit signature, since decorators that set
+        # it share one code object between all decorated functions.
+        return list(_get_kwarg_names(function))
+
+    try:
+        kwarg_names = _KWARG_NAMES_CACHE[code]
+    except KeyError:
+        kwarg_names = _KWARG_NAMES_CACHE[code] = _get_kwarg_names(function)
+
+    return list(kwarg_names)
+
+
+# Maps code objects to the keyword argument names of their functions.
+_KWARG_NAMES_CACHE = {}
+
+
+def _get_kwarg_names(function: Callable) -> tuple:
+    # Inspects the signature of the function. Called once per sample for
+    # every callable property, so the result is cached in
+    # _KWARG_NAMES_CACHE.
+
     try:
         argspec = inspect.getfullargspec(function)
     except TypeError:
-        return []
+        return ()
 
     if argspec.varargs:
-        return argspec.kwonlyargs or []
+        return tuple(argspec.kwonlyargs or ())
     else:
-        return argspec.args or []
+        return tuple(argspec.args or ())
 
 
 def kwarg_has_default(function: Callable, argument: str) -> bool:
@@ -3,6 +3,9 @@ import sys
 sys.path.append(".")  # Adds the module to path
 
 import unittest
+import copy
+import os
+import tempfile
 
 import deeptrack.features as features
 
@@ -120,6 +123,98 @@ class TestFeatures(unittest.TestCase):
         self.assertEqual(output_image[0].shape, (1, 1))
         self.assertEqual(output_image[1].shape, (2, 2))
 
+    def test_Feature_plus_chain(self):
+        class FeatureMultiplyAndAdd(features.Feature):
+            def get(self, image, value_to_add=0, **kwargs):
+                image = image * 2 + value_to_add
+                return image
+
+        feature1 = FeatureMultiplyAndAdd(value_to_add=1)
+        feature2 = FeatureMultiplyAndAdd(value_to_add=2)
+        feature3 = FeatureMultiplyAndAdd(value_to_add=3)
+        feature12 = feature1 + feature2
+        feature123 = feature12 + feature3
+        self.assertIsInstance(feature123, features.Chain)
+        self.assertListEqual(
+            feature123.properties["features"].sampling_rule,
+            [feature1, feature2, feature3],
+        )
+        self.assertListEqual(
+            feature12.properties["features"].sampling_rule, [feature1, feature2]
+        )
+        feature321 = feature3 + (feature2 + feature1)
+        self.assertListEqual(
+            feature321.properties["features"].sampling_rule,
+            [feature3, feature2, feature1],
+        )
+        feature123.update()
+        output_image = feature123.resolve(np.zeros((1, 1)))
+        self.assertEqual(output_image, 11)
+
+    def test_Feature_plus_chain_with_sampling_rule(self):
+        class FeatureMultiplyAndAdd(features.Feature):
+            def get(self, image, value_to_add=0, **kwargs):
+                image = image * 2 + value_to_add
+                return image
+
+        feature1 = FeatureMultiplyAndAdd(value_to_add=1)
+        feature2 = FeatureMultiplyAndAdd(value_to_add=2)
+        feature3 = FeatureMultiplyAndAdd(value_to_add=3)
+
+        feature12 = features.Chain(features=lambda: [feature1, feature2])
+        feature123 = feature12 + feature3
+        self.assertListEqual(
+            feature123.properties["features"].sampling_rule, [feature12, feature3]
+        )
+        feature123.update()
+        output_image = feature123.resolve(np.zeros((1, 1)))
+        self.assertEqual(output_image, 11)
+
+        feature_iterator = iter([[feature1, feature2]])
+        feature12 = features.Chain(features=feature_iterator)
+        feature123 = feature12 + feature3
+        self.assertListEqual(
+            feature123.properties["features"].sampling_rule, [feature12, feature3]
+        )
+        self.assertListEqual(next(feature_iterator), [feature1, feature2])
+
+    def test_Combine_repeated_feature(self):
+        class FeatureCountResolves(features.Feature):
+            __distributed__ = False
+            number_of_resolves = 0
+
+            def get(self, *args, **kwargs):
+                FeatureCountResolves.number_of_resolves += 1
+                return np.random.rand(2, 2)
+
+        feature1 = FeatureCountResolves()
+        feature2 = FeatureCountResolves()
+        combined = features.Combine(features=[feature1, feature2, feature1])
+        combined.update()
+        output_image = combined.resolve()
+        self.assertEqual(FeatureCountResolves.number_of_resolves, 2)
+        self.assertEqual(len(output_image), 3)
+        self.assertTrue(np.array_equal(output_image[0], output_image[2]))
+        self.assertIsNot(output_image[0], output_image[2])
+
+    def test_repeated_feature_updated_once(self):
+        feature1 = features.DummyFeature(value=lambda: np.random.rand())
+        feature2 = features.DummyFeature()
+        combined = features.Combine(features=[feature1, feature2, feature1])
+
+        number_of_updates = []
+        properties_update = feature1.properties.update
+
+        def counting_update(**kwargs):
+            number_of_updates.append(1)
+            return properties_update(**kwargs)
+
+        feature1.properties.update = counting_update
+        combined.update()
+        self.assertEqual(len(number_of_updates), 1)
+        combined.update()
+        self.assertEqual(len(number_of_updates), 2)
+
     def test_Feature_times_1(self):
         class FeatureAddValue(features.Feature):
             def get(self, image, value_to_add=0, **kwargs):
@@ -141,6 +236,54 @@ class TestFeatures(unittest.TestCase):
             output_image05 = feature05.resolve(input_image)
             self.assertTrue(output_image05[0, 0] == 0 or output_image05[0, 0] == 1)
 
+    def test_Feature_times_not_updated(self):
+        feature = features.DummyFeature(value=lambda: np.random.rand())
+        feature.update()
+        value = feature.value.current_value
+
+        feature0 = feature * 0
+        for _ in range(10):
+            feature0.update()
+            self.assertEqual(feature.value.current_value, value)
+
+        feature1 = feature * 1
+        feature1.update()
+        self.assertNotEqual(feature.value.current_value, value)
+
+    def test_Feature_times_overridden_probability(self):
+        class FeatureAddValue(features.Feature):
+            def get(self, image, value_to_add=0, **kwargs):
+                image = image + value_to_add
+                return image
+
+        input_image = np.zeros((1, 1))
+
+        feature0 = FeatureAddValue(value_to_add=lambda: np.random.rand()) * 0
+        outputs = []
+        for _ in range(3):
+            feature0.update()
+            outputs.append(feature0.resolve(input_image, probability=1)[0, 0])
+        self.assertEqual(len(set(outputs)), 3)
+
+        bound = features.Bind(
+            FeatureAddValue(value_to_add=lambda: np.random.rand()) * 0,
+            probability=1,
+        )
+        outputs = []
+        for _ in range(3):
+            bound.update()
+            outputs.append(bound.resolve(input_image)[0, 0])
+        self.assertEqual(len(set(outputs)), 3)
+
+        # Arguments of later updates of other features are not used
+        feature0 = (
+            FeatureAddValue(value_to_add=lambda is_label: 10 if is_label else 1) * 0
+        )
+        feature0.update()
+        features.DummyFeature().update(is_label=True)
+        output_image = feature0.resolve(input_image, probability=1)
+        self.assertEqual(output_image[0, 0], 1)
+
     def test_Feature_exp_1(self):
         class FeatureAddValue(features.Feature):
             def get(self, image, value_to_add=0, **kwargs):
@@ -225,6 +368,79 @@ class TestFeatures(unittest.TestCase):
                             self.assertIn(c - b, range(0, 100))
                             self.assertIn(dl[ci] - c, range(0, 10))
 
+    def test_Duplicate_shares_array_values(self):
+        A = features.DummyFeature(a=lambda: np.random.rand(4, 4))
+        A.update()
+        # Clears the update memoization of A
+        features.DummyFeature().update()
+        value = A.a.current_value
+
+        # Duplicate updates its copies before resolving them, so array
+        # values are shared when copying
+        duplicates = (A ** 2).properties["features"].sampling_rule(2)
+        for duplicate in duplicates:
+            self.assertIs(duplicate.a.current_value, value)
+
+        # A plain deepcopy copies them
+        A_copy = copy.deepcopy(A)
+        self.assertFalse(np.shares_memory(A_copy.a.current_value, value))
+        A_copy.a.current_value[0, 0] = 5
+        self.assertNotEqual(value[0, 0], 5)
+
+    def test_LoadImage_get_one_random(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for index in range(2):
+                paths.append(os.path.join(directory, "{0}.npy".format(index)))
+                np.save(paths[-1], np.random.rand(5, 4, 4))
+
+            load_image = features.LoadImage(
+                path=paths, as_list=True, get_one_random=True
+            )
+            for _ in range(5):
+                load_image.update()
+                output_image = load_image.resolve()
+                expected_image = load_image.resolve(
+                    load_options={"mmap_mode": None}
+                )
+                self.assertEqual(output_image.shape, (4, 4, 2))
+                self.assertTrue(np.array_equal(output_image, expected_image))
+
+            # Files of different lengths cannot be stacked
+            longer_path = os.path.join(directory, "longer.npy")
+            np.save(longer_path, np.random.rand(7, 4, 4))
+            for path in ([paths[0], longer_path], [longer_path, paths[0]]):
+                load_image = features.LoadImage(
+                    path=path, as_list=True, get_one_random=True
+                )
+                load_image.update()
+                self.assertRaises(ValueError, load_image.resolve)
+
+            # Object arrays cannot be memory-mapped
+            object_path = os.path.join(directory, "object.npy")
+            np.save(object_path, np.arange(3).astype(object), allow_pickle=True)
+            load_image = features.LoadImage(
+                path=object_path,
+                as_list=True,
+                get_one_random=True,
+                load_options={"allow_pickle": True},
+            )
+            load_image.update()
+            output_image = load_image.resolve()
+            expected_image = load_image.resolve(
+                load_options={"allow_pickle": True, "mmap_mode": None}
+            )
+            self.assertTrue(np.array_equal(output_image, expected_image))
+
+            # Arrays without dimensions have no images to choose from
+            scalar_path = os.path.join(directory, "scalar.npy")
+            np.save(scalar_path, np.array(3.0))
+            load_image = features.LoadImage(
+                path=scalar_path, as_list=True, get_one_random=True
+            )
+            load_image.update()
+            self.assertEqual(load_image.resolve(), 3.0)
+
     def test_LambdaDependence(self):
         A = features.DummyFeature(a=1, b=2, c=3)
 
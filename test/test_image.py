@@ -22,6 +22,15 @@ class TestImage(unittest.TestCase):
         output_image = particle.resolve(input_image)
         self.assertIsInstance(output_image, image.Image)
 
+    def test_Image_copy(self):
+        array = np.zeros((4, 4))
+        copied_image = image.Image(array)
+        self.assertFalse(np.shares_memory(copied_image, array))
+
+        viewed_image = image.Image(array, properties=[{"a": 1}], copy=False)
+        self.assertTrue(np.shares_memory(viewed_image, array))
+        self.assertEqual(viewed_image.properties, [{"a": 1}])
+
     def test_Image_properties(self):
         particle = self.Particle(position=(128, 128))
         input_image = image.Image(np.zeros((256, 256)))
@@ -8,6 +8,7 @@ import deeptrack.optics as optics
 
 from deeptrack.scatterers import PointParticle
 from deeptrack.image import Image
+import numpy as np
 
 
 class TestOptics(unittest.TestCase):
@@ -83,5 +84,67 @@ class TestOptics(unittest.TestCase):
         self.assertEqual(output_image.get_property("pupil_at_focus").shape, (128, 128))
 
 
+    def test_pupil_grid_cache(self):
+        optics._PUPIL_GRID_CACHE.clear()
+        parameters = dict(
+            NA=0.7,
+            wavelength=660e-9,
+            refractive_index_medium=1.33,
+            voxel_size=(1e-7, 1e-7, 1e-7),
+        )
+
+        grid = optics._get_pupil_grid((32, 32), **parameters)
+        self.assertIs(optics._get_pupil_grid((32, 32), **parameters), grid)
+        for array in grid:
+            self.assertFalse(array.flags.writeable)
+
+        for changed_parameters in (
+            {"voxel_size": (2e-7, 2e-7, 2e-7)},
+            {"NA": 0.8},
+        ):
+            other_grid = optics._get_pupil_grid(
+                (32, 32), **{**parameters, **changed_parameters}
+            )
+            self.assertIsNot(other_grid, grid)
+        self.assertIsNot(optics._get_pupil_grid((16, 16), **parameters), grid)
+
+        # Applying an aberration does not change the cached pupil
+        microscope = optics.Fluorescence()
+        pupil_arguments = dict(
+            upscale=1, pupil=None, defocus=[0, 1e-6], **parameters
+        )
+        pupils = microscope._pupil((32, 32), **pupil_arguments)
+        microscope._pupil(
+            (32, 32), aberration=np.full((32, 32), 0.5), **pupil_arguments
+        )
+        for pupil, new_pupil in zip(
+            pupils, microscope._pupil((32, 32), **pupil_arguments)
+        ):
+            self.assertTrue(np.array_equal(pupil, new_pupil))
+        self.assertIs(optics._get_pupil_grid((32, 32), **parameters), grid)
+
+    def test_pupil_grid_cache_eviction(self):
+        optics._PUPIL_GRID_CACHE.clear()
+        cache_size = optics.PUPIL_GRID_CACHE_SIZE
+        optics.PUPIL_GRID_CACHE_SIZE = 2
+        try:
+            parameters = dict(
+                NA=0.7,
+                wavelength=660e-9,
+                refractive_index_medium=1.33,
+                voxel_size=(1e-7, 1e-7, 1e-7),
+            )
+            grid = optics._get_pupil_grid((8, 8), **parameters)
+            optics._get_pupil_grid((10, 10), **parameters)
+            self.assertEqual(len(optics._PUPIL_GRID_CACHE), 2)
+
+            # The oldest entry is evicted
+            optics._get_pupil_grid((12, 12), **parameters)
+            self.assertEqual(len(optics._PUPIL_GRID_CACHE), 2)
+            self.assertIsNot(optics._get_pupil_grid((8, 8), **parameters), grid)
+        finally:
+            optics.PUPIL_GRID_CACHE_SIZE = cache_size
+            optics._PUPIL_GRID_CACHE.clear()
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -3,6 +3,7 @@ import sys
 sys.path.append(".")  # Adds the module to path
 
 import unittest
+import copy
 
 import deeptrack.properties as properties
 import deeptrack as dt
@@ -88,6 +89,59 @@ class TestProperties(unittest.TestCase):
             )
             property_dict.update()
 
+    def test_PropertyDict_current_value_dict_cache(self):
+        property_dict = properties.PropertyDict(
+            P1=properties.Property(iter([1, 2, 3])),
+        )
+        current_value_dict = property_dict.current_value_dict()
+        self.assertEqual(current_value_dict["P1"], 1)
+
+        # Mutating the returned dict should not affect later calls
+        current_value_dict["P1"] = 10
+        self.assertEqual(property_dict.current_value_dict()["P1"], 1)
+
+        property_dict.update()
+        self.assertEqual(property_dict.current_value_dict()["P1"], 2)
+
+        property_dict["P2"] = properties.Property(3)
+        self.assertEqual(property_dict.current_value_dict()["P2"], 3)
+
+    def test_PropertyDict_current_value_dict_reuses_cache(self):
+        number_of_reads = []
+
+        def read_current_value(self):
+            number_of_reads.append(1)
+            return properties.Property.current_value.fget(self)
+
+        class CountingProperty(properties.Property):
+            current_value = property(
+                read_current_value, properties.Property.current_value.fset
+            )
+
+        property_dict = properties.PropertyDict(P1=CountingProperty(1))
+        property_dict.current_value_dict()
+        reads_after_first_call = len(number_of_reads)
+        property_dict.current_value_dict()
+        self.assertEqual(len(number_of_reads), reads_after_first_call)
+
+        property_dict_copy = copy.deepcopy(property_dict)
+        self.assertIsNone(
+            getattr(property_dict_copy, "_current_value_dict_cache", None)
+        )
+        self.assertEqual(property_dict_copy.current_value_dict(), {"P1": 1})
+
+    def test_PropertyDict_current_value_dict_lazy_update(self):
+        property_dict = properties.PropertyDict(
+            P1=properties.Property(lambda: np.random.rand()),
+            P2=properties.Property(lambda P1: P1 + 1),
+        )
+        property_dict["P1"].update()
+
+        # Reading P2 samples it for the first time, which resamples P1
+        property_dict.current_value_dict()
+        current_value_dict = property_dict.current_value_dict()
+        self.assertEqual(current_value_dict["P2"], current_value_dict["P1"] + 1)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -6,6 +6,8 @@ import unittest
 
 import deeptrack.sequences as sequences
 
+from deeptrack.features import Feature
+from deeptrack.math import Add
 from deeptrack.optics import Fluorescence
 from deeptrack.scatterers import Ellipse
 import numpy as np
@@ -39,6 +41,27 @@ class TestSequences(unittest.TestCase):
         )
         self.assertIsInstance(imaged_rotating_ellipse_sequence, sequences.Sequence)
 
+    def test_Sequence_sequential_probability(self):
+        class Ones(Feature):
+            __distributed__ = False
+
+            def get(self, image, **kwargs):
+                return np.ones((1,))
+
+        feature = Add(value=1) * 0.5
+        sequences.Sequential(
+            feature, probability=lambda sequence_step: (sequence_step + 1) % 2
+        )
+        sequence = sequences.Sequence(Ones() + feature, sequence_length=4)
+        for _ in range(3):
+            sequence.update()
+            output = sequence.resolve()
+            self.assertEqual(len(output), 4)
+            self.assertIn(output[0][0], (1, 2))
+            self.assertEqual(output[1][0], 1)
+            self.assertEqual(output[2][0], 2)
+            self.assertEqual(output[3][0], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -3,6 +3,10 @@ import sys
 sys.path.append(".")  # Adds the module to path
 
 import unittest
+from unittest import mock
+import gc
+import inspect
+import weakref
 
 import deeptrack.utils as utils
 
@@ -67,6 +71,65 @@ class TestUtils(unittest.TestCase):
 
         self.assertEqual(utils.get_kwarg_names(func7), ["key1", "key2", "key3"])
 
+    def test_get_kwarg_names_cached(self):
+        def func(key1, key2=2):
+            pass
+
+        kwarg_names = utils.get_kwarg_names(func)
+        kwarg_names.append("key3")
+        self.assertEqual(utils.get_kwarg_names(func), ["key1", "key2"])
+
+        class UnhashableCallable:
+            __hash__ = None
+
+            def __call__(self, key1):
+                pass
+
+        self.assertIn("key1", utils.get_kwarg_names(UnhashableCallable()))
+
+        def make_func(value):
+            def func(key4, key5=value):
+                pass
+
+            return func
+
+        with mock.patch.object(
+            utils.inspect, "getfullargspec", wraps=utils.inspect.getfullargspec
+        ) as getfullargspec:
+            for value in range(3):
+                self.assertEqual(
+                    utils.get_kwarg_names(make_func(value)), ["key4", "key5"]
+                )
+            self.assertEqual(getfullargspec.call_count, 1)
+
+        def with_signature(func):
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            wrapper.__signature__ = inspect.signature(func)
+            return wrapper
+
+        @with_signature
+        def radius(z):
+            pass
+
+        @with_signature
+        def intensity(snr, background):
+            pass
+
+        self.assertEqual(utils.get_kwarg_names(radius), ["z"])
+        self.assertEqual(utils.get_kwarg_names(intensity), ["snr", "background"])
+
+    def test_get_kwarg_names_does_not_keep_function_alive(self):
+        def func(key1):
+            pass
+
+        func_ref = weakref.ref(func)
+        utils.get_kwarg_names(func)
+        del func
+        gc.collect()
+        self.assertIsNone(func_ref())
+
     def test_safe_call(self):
 
         arguments = {